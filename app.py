@@ -1,6 +1,4 @@
 import streamlit as st
-import pdfplumber
-import json
 import pandas as pd
 from io import BytesIO
 
@@ -8,10 +6,19 @@ from io import BytesIO
 # Import parsers
 # ---------------------------------------------------
 
-from maybank import parse_transactions_maybank
-from public_bank import parse_transactions_pbb
-from rhb import parse_transactions_rhb
-from cimb import parse_transactions_cimb
+from page_parser import parse_pdf
+
+# ---------------------------------------------------
+# Cached Parsing
+# ---------------------------------------------------
+
+@st.cache_data(show_spinner=False)
+def parse_pdf_cached(pdf_bytes, filename, bank_hint, default_year):
+    """
+    Streamlit reruns the whole script on every widget change; caching
+    on the file bytes and options means each PDF is parsed only once.
+    """
+    return parse_pdf(pdf_bytes, bank_hint, default_year, filename)
 
 # ---------------------------------------------------
 # Streamlit Setup
@@ -60,50 +67,27 @@ uploaded_files = st.file_uploader(
 # Main Processing
 # ---------------------------------------------------
 
-all_tx = []
+# (filename, transactions) for each file that produced rows
+file_tx = []
 
 if uploaded_files:
     for uploaded_file in uploaded_files:
         st.write(f"Processing: **{uploaded_file.name}**")
 
         try:
-            with pdfplumber.open(uploaded_file) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-
-                    text = page.extract_text() or ""
-                    tx = []
-
-                    if bank_hint == "maybank":
-                        tx = parse_transactions_maybank(
-                            text,
-                            page_num,
-                            default_year
-                        )
-
-                    elif bank_hint == "pbb":
-                        tx = parse_transactions_pbb(
-                            text,
-                            page_num,
-                            default_year
-                        )
-
-                    elif bank_hint == "rhb":
-                        tx = parse_transactions_rhb(
-                            text,
-                            page_num
-                        )
-
-                    elif bank_hint == "cimb":
-                        tx = parse_transactions_cimb(
-                            page,
-                            page_num,
-                            uploaded_file.name
-                        )
-
-                    if tx:
-                        for t in tx:
-                            t["source_file"] = uploaded_file.name
-                        all_tx.extend(tx)
+            # getvalue() ignores the stream position, so reruns and any
+            # later reuse see the full file without another read()
+            pdf_bytes = uploaded_file.getvalue()
+
+            tx = parse_pdf_cached(
+                pdf_bytes,
+                uploaded_file.name,
+                bank_hint,
+                default_year
+            )
+
+            if tx:
+                file_tx.append((uploaded_file.name, tx))
 
         except Exception as e:
             st.error(f"Error processing {uploaded_file.name}: {e}")
@@ -112,22 +96,29 @@ if uploaded_files:
 # Display Results & Monthly Summary
 # ---------------------------------------------------
 
-if all_tx:
+if file_tx:
     st.subheader("📋 Extracted Transactions")
 
-    df = pd.DataFrame(all_tx)
-
-    # Enforce column order
+    # Enforce column order: selects/orders the keys of row dicts and
+    # of Maybank's column dict
     columns = [
         "date",
         "description",
         "debit",
         "credit",
         "balance",
-        "page",
-        "source_file"
+        "page"
     ]
-    df = df[[c for c in columns if c in df.columns]]
+
+    # source_file is broadcast per file instead of set on every row
+    df = pd.concat(
+        [
+            pd.DataFrame(tx, columns=columns)
+            .assign(source_file=name)
+            for name, tx in file_tx
+        ],
+        ignore_index=True
+    )
 
     # -----------------------------------------------
     # Normalize data types (for calculations)
@@ -135,15 +126,18 @@ if all_tx:
 
     df["date"] = pd.to_datetime(df["date"], errors="coerce")
 
-    for col in ["debit", "credit", "balance"]:
+    for col in ("debit", "credit", "balance"):
         if col in df.columns:
-            df[col] = (
-                df[col]
-                .astype(str)
-                .str.replace(",", "", regex=False)
-                .replace("", "0")
-                .astype(float)
-            )
+            values = df[col]
+
+            # Parsers mostly return floats already; only strings need cleanup
+            if not pd.api.types.is_numeric_dtype(values):
+                values = pd.to_numeric(
+                    values.astype(str).str.replace(",", "", regex=False),
+                    errors="coerce"
+                )
+
+            df[col] = values.fillna(0.0)
 
     st.dataframe(df, use_container_width=True)
 
@@ -153,6 +147,16 @@ if all_tx:
 
     df["month"] = df["date"].dt.to_period("M").astype(str)
 
+    # Dedupe (month, file) pairs up front so the per-month join only
+    # sees unique, already sorted names
+    source_files = (
+        df[["month", "source_file"]]
+        .drop_duplicates()
+        .sort_values(["month", "source_file"])
+        .groupby("month")["source_file"]
+        .agg(", ".join)
+    )
+
     monthly_summary = (
         df.groupby("month")
         .agg(
@@ -161,9 +165,9 @@ if all_tx:
             ending_balance=("balance", "last"),
             lowest_balance=("balance", "min"),
             highest_balance=("balance", "max"),
-            transaction_count=("date", "count"),
-            source_files=("source_file", lambda x: ", ".join(sorted(set(x))))
+            transaction_count=("date", "count")
         )
+        .assign(source_files=source_files)
         .reset_index()
         .sort_values("month")
     )
@@ -179,9 +183,12 @@ if all_tx:
     if "date" in df_json.columns:
         df_json["date"] = df_json["date"].dt.strftime("%Y-%m-%d")
 
-    json_data = json.dumps(
-        df_json.to_dict(orient="records"),
-        indent=4
+    # pandas' C writer, no intermediate list of row dicts
+    json_data = df_json.to_json(
+        orient="records",
+        indent=4,
+        force_ascii=False,
+        double_precision=2
     )
 
     st.download_button(
@@ -195,8 +202,11 @@ if all_tx:
     # Excel Export (2 Sheets)
     # -----------------------------------------------
 
+    # xlsxwriter streams XML straight out instead of building an
+    # openpyxl cell tree. constant_memory is left off: pandas writes
+    # column by column and that mode silently drops earlier rows.
     output = BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
+    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
         df.to_excel(
             writer,
             index=False,
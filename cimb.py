@@ -1,11 +1,14 @@
 import re
 
+# Compiled once at import; parse_float runs for every table cell
+NUMBER_PATTERN = re.compile(r'^-?\d+(\.\d+)?$')
+
 def parse_float(value):
     """Converts string '1,234.56' to float 1234.56. Returns 0.0 if empty."""
     if not value:
         return 0.0
     clean_val = str(value).replace("\n", "").replace(" ", "").replace(",", "")
-    if not re.match(r'^-?\d+(\.\d+)?$', clean_val):
+    if not NUMBER_PATTERN.match(clean_val):
         return 0.0
     return float(clean_val)
 
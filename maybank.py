@@ -1,73 +1,108 @@
 import regex as re
 
 # ============================================================
-# MTASB PATTERN (Maybank Variant)
-# Example: "01/05 TRANSFER TO A/C 320.00+ 43,906.52"
+# COMBINED PATTERN (MTASB | MBB), ONE PASS OVER THE PAGE
+#
+# MTASB example: "01/05 TRANSFER TO A/C 320.00+ 43,906.52"
+# MBB example:   "01 Feb 2025 CMS - DR CORP CHG 78.00 - 50,405.76"
+#
+# MULTILINE finditer() walks the whole page once. The date must open
+# its line (after optional spaces or tabs), and [ \t] separators keep
+# a match from running onto the next line.
+#
+# The two-digit day both formats open with is matched once, ahead of
+# the alternation, so other lines fail on their first character.
+#
+# Descriptions start on a non-space character, so the capture carries
+# no edge whitespace and needs no .strip().
 # ============================================================
 
-PATTERN_MAYBANK_MTASB = re.compile(
-    r"(\d{2}/\d{2})\s+"             # 01/05
-    r"(.+?)\s+"                     # description
-    r"([0-9,]+\.\d{2})([+-])\s+"    # amount + sign
-    r"([0-9,]+\.\d{2})"             # balance
+PATTERN_MAYBANK = re.compile(
+    r"^[ \t]*(?P<day>\d{2})(?:"                          # shared day prefix
+    # --- MTASB ---
+    r"(?:"
+    r"/(?P<mtasb_month>\d{2})[ \t]+"                     # /05
+    r"(?P<mtasb_desc>\S.*?)[ \t]+"                       # description
+    r"(?P<mtasb_amount>[0-9,]+\.\d{2})"                  # amount
+    r"(?P<mtasb_sign>[+-])[ \t]+"                        # sign
+    r"(?P<mtasb_balance>[0-9,]+\.\d{2})"                 # balance
+    r")"
+    r"|"
+    # --- MBB (balance-driven) ---
+    r"(?:"
+    r"[ \t]+(?P<mbb_mon>[A-Za-z]{3})"                    # Feb
+    r"[ \t]+(?P<mbb_year>\d{4})[ \t]+"                   # 2025
+    r"(?P<mbb_desc>\S.*?)[ \t]+"                         # description
+    r"[0-9,]+\.\d{2}[ \t]+[+-][ \t]+"                    # ignore amount & sign
+    r"(?P<mbb_balance>[0-9,]+\.\d{2})"                   # balance
+    r")"
+    r")",
+    re.MULTILINE,
 )
 
+# Group order in the pattern above. The parser unpacks m.groups() in
+# this order: one call per match instead of a lookup per named field.
+#   day, mtasb_month, mtasb_desc, mtasb_amount, mtasb_sign,
+#   mtasb_balance, mbb_mon, mbb_year, mbb_desc, mbb_balance
 
-def parse_line_maybank_mtasb(line, page_num, default_year="2025"):
-    m = PATTERN_MAYBANK_MTASB.search(line)
-    if not m:
-        return None
-
-    date_raw, desc, amount_raw, sign, balance_raw = m.groups()
-    day, month = date_raw.split("/")
-    year = default_year
-
-    amount = float(amount_raw.replace(",", ""))
-    balance = float(balance_raw.replace(",", ""))
+# Cheap page-level check: no line starts with "DD/MM" or "DD Mon YYYY"
+# means no transactions (cover pages, disclosures, inserts)
+FAST_REJECT = re.compile(
+    r"^[ \t]*\d{2}(?:/\d{2}|[ \t]+[A-Za-z]{3}[ \t]+\d{4})",
+    re.MULTILINE,
+)
 
-    credit = amount if sign == "+" else 0.0
-    debit  = amount if sign == "-" else 0.0
+# Rows are built as plain tuples in this field order, then returned
+# column-wise: one list per field, keyed by name. app.py builds the
+# DataFrame straight from the columns, so no per-row dict is created.
+TX_FIELDS = ("date", "description", "debit", "credit", "balance", "page")
 
-    full_date = f"{year}-{month}-{day}"
+_MONTHS = {
+    "jan": "01", "feb": "02", "mar": "03", "apr": "04",
+    "may": "05", "jun": "06", "jul": "07", "aug": "08",
+    "sep": "09", "oct": "10", "nov": "11", "dec": "12",
+}
 
-    return {
-        "date": full_date,
-        "description": desc.strip(),
-        "debit": debit,
-        "credit": credit,
-        "balance": balance,
-        "page": page_num,
-    }
+# "jan", "Jan" and "JAN" all hit directly, with no string call per
+# match; .lower() is only the fallback for odd casing like "jAN"
+MONTH_MAP = {
+    key: num
+    for mon, num in _MONTHS.items()
+    for key in (mon, mon.title(), mon.upper())
+}
 
 
 # ============================================================
-# MBB PATTERN (Balance-Driven)
-# Example:
-# "01 Feb 2025 CMS - DR CORP CHG 78.00 - 50,405.76"
+# MTASB MATCH → TRANSACTION
 # ============================================================
 
-PATTERN_MAYBANK_MBB = re.compile(
-    r"(\d{2})\s+([A-Za-z]{3})\s+(\d{4})\s+"  # 01 Feb 2025
-    r"(.+?)\s+"                              # description
-    r"[0-9,]+\.\d{2}\s+[+-]\s+"              # ignore amount & sign
-    r"([0-9,]+\.\d{2})"                      # balance
-)
+# Amounts stay as raw strings ("43,906.52"); app.py converts the
+# whole column at once with pd.to_numeric.
 
-MONTH_MAP = {
-    "Jan": "01", "Feb": "02", "Mar": "03", "Apr": "04",
-    "May": "05", "Jun": "06", "Jul": "07", "Aug": "08",
-    "Sep": "09", "Oct": "10", "Nov": "11", "Dec": "12",
-}
+def build_tx_mtasb(day, month, desc, amount, sign, balance, page_num,
+                   default_year="2025"):
+    credit = amount if sign == "+" else "0"
+    debit  = amount if sign == "-" else "0"
 
+    full_date = f"{default_year}-{month}-{day}"
 
-def parse_line_maybank_mbb(line, page_num, prev_balance):
-    m = PATTERN_MAYBANK_MBB.search(line)
-    if not m:
-        return None, prev_balance
+    return (
+        full_date,
+        desc,
+        debit,
+        credit,
+        balance,
+        page_num,
+    )
 
-    day, mon_abbr, year, desc, balance_raw = m.groups()
-    month = MONTH_MAP.get(mon_abbr.title(), "01")
-    balance = float(balance_raw.replace(",", ""))
+
+# ============================================================
+# MBB MATCH → TRANSACTION (debit/credit from balance change)
+# ============================================================
+
+def build_tx_mbb(day, mon, year, desc, balance_str, page_num, prev_balance):
+    month = MONTH_MAP.get(mon) or MONTH_MAP.get(mon.lower(), "01")
+    balance = float(balance_str.replace(",", ""))
 
     # First balance seen → cannot infer debit/credit yet
     if prev_balance is None:
@@ -80,14 +115,14 @@ def parse_line_maybank_mbb(line, page_num, prev_balance):
 
     full_date = f"{year}-{month}-{day}"
 
-    tx = {
-        "date": full_date,
-        "description": desc.strip(),
-        "debit": debit,
-        "credit": credit,
-        "balance": balance,
-        "page": page_num,
-    }
+    tx = (
+        full_date,
+        desc,
+        debit,
+        credit,
+        balance,
+        page_num,
+    )
 
     return tx, balance
 
@@ -97,25 +132,37 @@ def parse_line_maybank_mbb(line, page_num, prev_balance):
 # ============================================================
 
 def parse_transactions_maybank(text, page_num, default_year="2025"):
+    """
+    Returns the page's transactions as {field: [values]} in TX_FIELDS
+    order, or an empty dict when the page has none.
+    """
+    if not FAST_REJECT.search(text):
+        return {}
+
     tx_list = []
     prev_mbb_balance = None
 
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
+    for m in PATTERN_MAYBANK.finditer(text):
+        (day, month, desc, amount, sign, balance,
+         mon, year, mbb_desc, mbb_balance) = m.groups()
 
         # --- MTASB ---
-        tx = parse_line_maybank_mtasb(line, page_num, default_year)
-        if tx:
-            tx_list.append(tx)
+        if month is not None:
+            tx_list.append(build_tx_mtasb(
+                day, month, desc, amount, sign, balance, page_num,
+                default_year
+            ))
             continue
 
         # --- MBB (balance-based) ---
-        tx, prev_mbb_balance = parse_line_maybank_mbb(
-            line, page_num, prev_mbb_balance
+        tx, prev_mbb_balance = build_tx_mbb(
+            day, mon, year, mbb_desc, mbb_balance, page_num, prev_mbb_balance
         )
         if tx:
             tx_list.append(tx)
 
-    return tx_list
+    if not tx_list:
+        return {}
+
+    # Transpose rows into columns in C rather than appending field by field
+    return dict(zip(TX_FIELDS, map(list, zip(*tx_list))))
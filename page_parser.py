@@ -0,0 +1,164 @@
+import os
+import tempfile
+from io import BytesIO
+
+import pdfplumber
+import pymupdf
+
+from maybank import parse_transactions_maybank
+from public_bank import parse_transactions_pbb
+from rhb import parse_transactions_rhb
+from cimb import parse_transactions_cimb
+
+# ============================================================
+# TEXT EXTRACTION (PyMuPDF)
+# ============================================================
+
+LINE_Y_TOLERANCE = 3
+
+
+def extract_page_text(page):
+    """
+    Rebuild pdfplumber-style lines from a PyMuPDF page.
+    Plain get_text("text") emits table cells as separate lines, which
+    breaks the line-based parsers, so words are clustered into lines by
+    the bottom of their boxes and joined left to right. As in
+    pdfplumber, each word is compared with the one before it, so a line
+    mixing font sizes or with slightly offset words stays together.
+    """
+    words = page.get_text("words")
+    if not words:
+        return ""
+
+    words.sort(key=lambda w: (w[3], w[0]))
+
+    lines = []
+    current = [words[0]]
+    for prev, w in zip(words, words[1:]):
+        if w[3] - prev[3] <= LINE_Y_TOLERANCE:
+            current.append(w)
+        else:
+            lines.append(current)
+            current = [w]
+    lines.append(current)
+
+    return "\n".join(
+        " ".join(w[4] for w in sorted(line, key=lambda w: w[0]))
+        for line in lines
+    )
+
+
+# ============================================================
+# SINGLE PAGE DISPATCH
+# ============================================================
+
+def open_document(source, bank_hint):
+    """source is the PDF bytes, or a file path for large statements."""
+    is_path = isinstance(source, str)
+
+    # CIMB needs pdfplumber page objects for extract_table().
+    # No laparams: extract_table() works from raw chars and ruling
+    # lines, and pdfminer layout analysis only adds time.
+    if bank_hint == "cimb":
+        return pdfplumber.open(source if is_path else BytesIO(source))
+
+    if is_path:
+        return pymupdf.open(source)
+    return pymupdf.open(stream=source, filetype="pdf")
+
+
+def page_count(doc, bank_hint):
+    if bank_hint == "cimb":
+        return len(doc.pages)
+    return doc.page_count
+
+
+def parse_page(doc, page_index, bank_hint, default_year, source_file,
+               prev_balance=None):
+    page_num = page_index + 1
+
+    if bank_hint == "cimb":
+        page = doc.pages[page_index]
+        try:
+            return parse_transactions_cimb(page, page_num, source_file)
+        finally:
+            # Release the cached chars/lines/rects of a finished page
+            page.close()
+
+    text = extract_page_text(doc[page_index])
+
+    if bank_hint == "maybank":
+        return parse_transactions_maybank(text, page_num, default_year)
+
+    if bank_hint == "pbb":
+        return parse_transactions_pbb(text, page_num, default_year)
+
+    if bank_hint == "rhb":
+        return parse_transactions_rhb(
+            text, page_num, prev_balance=prev_balance
+        )
+
+    return []
+
+
+# ============================================================
+# MAIN ENTRY: PARSE ALL PAGES OF ONE PDF
+# ============================================================
+
+# Larger uploads are written to a temp file and opened by path, so
+# the readers page the file in from disk instead of parsing from one
+# large in-memory stream.
+SPILL_TO_DISK_BYTES = 100 * 1024 * 1024
+
+
+def parse_pdf(pdf_bytes, bank_hint, default_year, source_file):
+    """
+    Parses every page of one statement and returns its transactions
+    in page order: a list of rows, or a dict of column lists for
+    Maybank. The document is opened once for all its pages.
+    """
+    if len(pdf_bytes) <= SPILL_TO_DISK_BYTES:
+        return _parse_source(pdf_bytes, bank_hint, default_year, source_file)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "statement.pdf")
+        with open(path, "wb") as f:
+            f.write(pdf_bytes)
+        return _parse_source(path, bank_hint, default_year, source_file)
+
+
+def _merge_pages(page_results):
+    """
+    Concatenates per-page results in page order. Most parsers return a
+    list of rows per page; Maybank returns a dict of column lists, which
+    is extended column by column.
+    """
+    merged = None
+    for tx in page_results:
+        if not tx:
+            continue
+        if merged is None:
+            merged = tx
+        elif isinstance(tx, dict):
+            for field, values in tx.items():
+                merged[field].extend(values)
+        else:
+            merged.extend(tx)
+    return merged or []
+
+
+def _parse_source(source, bank_hint, default_year, source_file):
+    with open_document(source, bank_hint) as doc:
+        page_results = []
+        prev_balance = None
+        for page_index in range(page_count(doc, bank_hint)):
+            tx = parse_page(
+                doc, page_index, bank_hint, default_year, source_file,
+                prev_balance
+            )
+            # RHB infers debit/credit from the previous page's closing
+            # balance, so that balance is threaded into the next page
+            if tx and bank_hint == "rhb":
+                prev_balance = tx[-1]["balance"]
+            page_results.append(tx)
+        return _merge_pages(page_results)
@@ -11,12 +11,6 @@ MONTH_MAP = {
     "Oct": "10", "Nov": "11", "Dec": "12"
 }
 
-# ============================================================
-# INTERNAL STATE (PERSISTS ACROSS PAGES)
-# ============================================================
-
-_prev_balance_global = None
-
 # ============================================================
 # SIMPLE DESCRIPTION CLEANER
 # ============================================================
@@ -48,8 +42,11 @@ def compute_debit_credit(prev_balance, curr_balance):
 # FIRST TRANSACTION SCAN METHOD
 # ============================================================
 
+PATTERN_WHITESPACE = re.compile(r"\s+")
+
+
 def classify_first_tx(desc, amount):
-    s = re.sub(r"\s+", "", desc or "").upper()
+    s = PATTERN_WHITESPACE.sub("", desc or "").upper()
     if (
         "DEPOSIT" in s or
         "CDT" in s or
@@ -101,43 +98,47 @@ PATTERN_TX_C = re.compile(
 # PARSE A SINGLE LINE (TRY FORMAT C → A → B)
 # ============================================================
 
-def parse_line_rhb(line, page_num, year=2025):
+# Returns (date, description, amount_raw, balance), or None for lines
+# that are not transactions. A plain tuple rather than a dict: the
+# caller unpacks it straight away.
+
+def parse_line_rhb(line, year=2025):
 
     line = line.strip()
     if not line:
         return None
 
-    # -------- FORMAT C: Islamic PDF (Jan 2025) --------
-    mC = PATTERN_TX_C.match(line)
-    if mC:
-        day, mon, desc, serial, amt1, amt2 = mC.groups()
-        date_fmt = f"{year}-{MONTH_MAP.get(mon, '01')}-{day.zfill(2)}"
-        return {
-            "type": "tx",
-            "date": date_fmt,
-            "description": fix_description(desc),
-            "amount_raw": float(amt1.replace(",", "")),
-            "balance": float(amt2.replace(",", "")),
-            "page": page_num,
-        }
-
-    # -------- FORMAT A: Old RHB PDF --------
-    mA = PATTERN_TX_A.match(line)
-    if mA:
-        day, mon, desc, serial, amt1, amt2 = mA.groups()
-        date_fmt = f"{year}-{MONTH_MAP.get(mon, '01')}-{day.zfill(2)}"
-        return {
-            "type": "tx",
-            "date": date_fmt,
-            "description": fix_description(desc),
-            "amount_raw": float(amt1.replace(",", "")),
-            "balance": float(amt2.replace(",", "")),
-            "page": page_num,
-        }
-
-    # -------- B/F or C/F --------
-    if PATTERN_BF_CF.match(line):
-        return {"type": "bf_cf"}
+    # Formats C, A and B/F-C/F all open with the day, so lines that
+    # don't start with a digit (headers, footers) skip those regexes
+    if line[0].isdigit():
+
+        # -------- FORMAT C: Islamic PDF (Jan 2025) --------
+        mC = PATTERN_TX_C.match(line)
+        if mC:
+            day, mon, desc, serial, amt1, amt2 = mC.groups()
+            date_fmt = f"{year}-{MONTH_MAP.get(mon, '01')}-{day.zfill(2)}"
+            return (
+                date_fmt,
+                fix_description(desc),
+                float(amt1.replace(",", "")),
+                float(amt2.replace(",", "")),
+            )
+
+        # -------- FORMAT A: Old RHB PDF --------
+        mA = PATTERN_TX_A.match(line)
+        if mA:
+            day, mon, desc, serial, amt1, amt2 = mA.groups()
+            date_fmt = f"{year}-{MONTH_MAP.get(mon, '01')}-{day.zfill(2)}"
+            return (
+                date_fmt,
+                fix_description(desc),
+                float(amt1.replace(",", "")),
+                float(amt2.replace(",", "")),
+            )
+
+        # -------- B/F or C/F: not a transaction, skip --------
+        if PATTERN_BF_CF.match(line):
+            return None
 
     # -------- FORMAT B: Online Banking --------
     mB = PATTERN_TX_B.search(line)
@@ -153,14 +154,7 @@ def parse_line_rhb(line, page_num, year=2025):
         if sign == "-":
             bal = -bal
 
-        return {
-            "type": "tx",
-            "date": date_fmt,
-            "description": f"{branch} {desc}",
-            "amount_raw": debit + credit,
-            "balance": bal,
-            "page": page_num,
-        }
+        return date_fmt, f"{branch} {desc}", debit + credit, bal
 
     return None
 
@@ -169,41 +163,36 @@ def parse_line_rhb(line, page_num, year=2025):
 # MAIN PARSER
 # ============================================================
 
-def parse_transactions_rhb(text, page_num, year=2025):
-    global _prev_balance_global
-
-    # Restart on page 1
-    if page_num == 1:
-        _prev_balance_global = None
-
+def parse_transactions_rhb(text, page_num, year=2025, prev_balance=None):
+    """
+    prev_balance is the last balance of the previous page (None on the
+    first page of a file). The caller threads it between pages so no
+    state leaks across files or processes.
+    """
     tx_list = []
 
     for raw_line in text.splitlines():
-        parsed = parse_line_rhb(raw_line, page_num, year)
+        parsed = parse_line_rhb(raw_line, year)
         if not parsed:
             continue
 
-        if parsed["type"] == "bf_cf":
-            continue
-
-        curr_balance = parsed["balance"]
-        amount = parsed["amount_raw"]
+        date, description, amount, curr_balance = parsed
 
         # First TX = scan method
-        if _prev_balance_global is None:
-            debit, credit = classify_first_tx(parsed["description"], amount)
+        if prev_balance is None:
+            debit, credit = classify_first_tx(description, amount)
         else:
-            debit, credit = compute_debit_credit(_prev_balance_global, curr_balance)
+            debit, credit = compute_debit_credit(prev_balance, curr_balance)
 
         tx_list.append({
-            "date": parsed["date"],
-            "description": parsed["description"],
+            "date": date,
+            "description": description,
             "debit": debit,
             "credit": credit,
             "balance": curr_balance,
             "page": page_num,
         })
 
-        _prev_balance_global = curr_balance
+        prev_balance = curr_balance
 
     return tx_list
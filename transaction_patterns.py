@@ -10,7 +10,7 @@ import regex as re
 # Example: "01/05 TRANSFER TO A/C 320.00+ 43,906.52"
 PATTERN_MTASB = re.compile(
     r"(\d{2}/\d{2})\s+"             # date: 01/05
-    r"(.+?)\s+"                     # description
+    r"(\S.*?)\s+"                   # description, no edge whitespace
     r"([0-9,]+\.\d{2})([+-])\s+"    # amount + sign: 320.00+
     r"([0-9,]+\.\d{2})"             # balance
 )
@@ -19,7 +19,7 @@ PATTERN_MTASB = re.compile(
 # Example: "01 Apr 2025 CMS - DR CORP CHG 78.00 - 71,229.76"
 PATTERN_MBB = re.compile(
     r"(\d{2})\s+([A-Za-z]{3})\s+(\d{4})\s+"  # 01 Apr 2025
-    r"(.+?)\s+"                              # description
+    r"(\S.*?)\s+"                            # description, no edge whitespace
     r"([0-9,]+\.\d{2})\s+([+-])\s+"          # 78.00 -
     r"([0-9,]+\.\d{2})"                      # 71,229.76
 )
@@ -63,7 +63,7 @@ def parse_line_mtasb(line: str, page_num: int, default_year: str = "2025"):
 
     return {
         "date": full_date,
-        "description": desc.strip(),
+        "description": desc,
         "debit": debit,
         "credit": credit,
         "balance": balance,
@@ -97,7 +97,7 @@ def parse_line_mbb(line: str, page_num: int):
 
     return {
         "date": full_date,
-        "description": desc.strip(),
+        "description": desc,
         "debit": debit,
         "credit": credit,
         "balance": balance,